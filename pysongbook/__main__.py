@@ -1,4 +1,5 @@
 import argparse
+import concurrent.futures
 import logging
 import sys
 from pathlib import Path
@@ -6,31 +7,32 @@ from pathlib import Path
 import pysongbook.io
 import pysongbook.model
 
-FORMATS = {}
-for name in dir(pysongbook.io):
-    val = getattr(pysongbook.io, name)
-    if isinstance(val, type) and issubclass(val, pysongbook.io.SongFormat):
-        FORMATS[val.name] = val
+FORMATS = pysongbook.io.SongFormat.registry
 
 
 def get_inputs(input_path: Path | None, encoding: str) -> list[tuple[str, str]]:
     if input_path is None:
         inputs = [("stdin", sys.stdin.read())]
     elif input_path.is_dir():
-        inputs = [(str(fpath), fpath.open(encoding=encoding).read()) for fpath in input_path.iterdir() if fpath.is_file()]
+        # Reading a directory of many small files is syscall-latency-bound; overlap the reads.
+        files = [fpath for fpath in input_path.iterdir() if fpath.is_file()]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+            contents = executor.map(lambda fpath: fpath.read_text(encoding=encoding), files)
+            inputs = [(str(fpath), content) for fpath, content in zip(files, contents)]
     else:
-        inputs = [(str(input_path), input_path.open(encoding=encoding).read())]
+        inputs = [(str(input_path), input_path.read_text(encoding=encoding))]
     return inputs
 
 
 def parse_inputs(inputs: list[tuple[str, str]], parser_format: pysongbook.io.SongFormat) -> list[pysongbook.model.Song]:
     if not parser_format.can_read:
         raise ValueError(f"format {type(parser_format)!r} has no read capability")
-    songs = []
-    for pathname, inp in inputs:
+    for pathname, _ in inputs:
         logging.info("Parsing %s", pathname)
-        songs.append(parser_format.loads(inp))
-    return songs
+    if len(inputs) == 1:  # not worth the worker process startup
+        return [parser_format.loads(inputs[0][1])]
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        return list(executor.map(parser_format.loads, [inp for _, inp in inputs], chunksize=8))
 
 
 parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
@@ -44,12 +46,19 @@ parser.add_argument("-c", "--encoding", default="utf8", help="input file(s) enco
 parser.add_argument("-N", "--no-normalize", action="store_true", help="input file(s) encoding")
 
 
+def create_format(name: str, params: list[tuple[str, str]] | None) -> pysongbook.io.SongFormat:
+    song_format = FORMATS[name]()
+    for key, value in params or []:
+        setattr(song_format, key, value)
+    return song_format
+
+
 if __name__ == "__main__":
     args = parser.parse_args()
     logging.info("Creating parser format %s", args.in_format)
-    parser_format = FORMATS[args.in_format](**dict(args.in_param or []))
+    parser_format = create_format(args.in_format, args.in_param)
     logging.info("Creating output format %s", args.out_format)
-    output_format = FORMATS[args.out_format](**dict(args.out_param or []))
+    output_format = create_format(args.out_format, args.out_param)
     all_inputs = get_inputs(args.input, encoding=args.encoding)
     # TODO handle multi-song files
     parsed = parse_inputs(all_inputs, parser_format)
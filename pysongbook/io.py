@@ -1,11 +1,13 @@
 import abc
 import dataclasses
 import functools
+import itertools
 import json
+import sys
 import warnings
 from abc import ABC
 import re
-from typing import Callable, Generator, Type, Any
+from typing import Callable, ClassVar, Generator, Type, Any, get_args
 
 from pysongbook.model import (
     AddedNote,
@@ -20,10 +22,13 @@ from pysongbook.model import (
     CodaMark,
     DominantSeventh,
     EmptyStropheMark,
+    GenericAnnotation,
     GenericChordModifier,
     LetteredStropheMark,
     MajorSeventh,
+    MalformedSongError,
     Minor,
+    Note,
     NumberedStropheMark,
     PlainSegment,
     Song,
@@ -71,6 +76,14 @@ class TurnChordsOff(ProcessingInstruction):
 
 
 class SongFormat(ABC):
+    registry: ClassVar[dict[str, Type["SongFormat"]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Register concrete formats by name at class definition time.
+        super().__init_subclass__(**kwargs)
+        if isinstance(getattr(cls, "name", None), str):
+            cls.registry[cls.name] = cls
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
@@ -87,8 +100,15 @@ class SongFormat(ABC):
         ...
 
 
-def _parse_altered_modifier_match(match: re.Match) -> Altered:
-    return Altered(direction=match.group(1), factor=(5 if not match.group(2) else int(match.group(2))))
+@functools.lru_cache(maxsize=64)
+def _spaces(n: int) -> str:
+    return " " * n
+
+
+def _parse_altered_modifier(modif_str: str) -> Altered:
+    direction = modif_str.rstrip("0123456789")
+    factor_str = modif_str[len(direction):]
+    return Altered(direction=direction, factor=(int(factor_str) if factor_str else 5))
 
 
 class ChordParser(abc.ABC):
@@ -100,54 +120,80 @@ class ChordParser(abc.ABC):
 class DefaultChordParser:
     tone_pattern_str = r"[A-H](?:#|b)?"
     tone_pattern = re.compile(tone_pattern_str)
-    modifier_patterns: tuple[re.Pattern, Callable[..., ChordModifier], bool] = [
-        (re.compile(r"maj7?"), MajorSeventh, False),
-        (re.compile(r"m"), Minor, False),
-        (re.compile(r"7"), DominantSeventh, False),
-        (re.compile(r"\d+"), (lambda match: AddedNote(int(match.group()))), True),
-        (re.compile(r"sus(\d)"), (lambda match: Suspended(int(match.group(1)))), True),
-        (re.compile(r"(\+|dim)(\d)?"), _parse_altered_modifier_match, True),
-        (re.compile(r"/" + tone_pattern_str), (lambda match: BassNote(match.group()[1:])), True),
-    ]
+    # All modifier sub-patterns fused into one alternation so that each modifier token is recognized
+    # by a single C-level regex scan; the branch that fired is dispatched via match.lastgroup.
+    modifier_pattern: re.Pattern = re.compile(
+        r"(?P<maj>maj7?)"
+        r"|(?P<minor>m)"
+        r"|(?P<dom>7)"
+        r"|(?P<add>\d+)"
+        r"|(?P<sus>sus\d)"
+        r"|(?P<alt>(?:\+|dim)\d?)"
+        r"|(?P<bass>/" + tone_pattern_str + r")"
+    )
+    # The handful of modifier strings below covers the vast majority of real chords; they are
+    # recognized by one dict lookup on the whole suffix before the regex machinery gets involved.
+    common_modifier_strings: dict[str, tuple[ChordModifier, ...]] = {
+        "": (),
+        "m": (Minor(),),
+        "7": (DominantSeventh(),),
+        "m7": (Minor(), DominantSeventh()),
+        "maj7": (MajorSeventh(),),
+        "sus2": (Suspended(2),),
+        "sus4": (Suspended(4),),
+    }
+    modifier_converters: dict[str, Callable[[str], ChordModifier]] = {
+        "maj": (lambda modif_str: MajorSeventh()),
+        "minor": (lambda modif_str: Minor()),
+        "dom": (lambda modif_str: DominantSeventh()),
+        "add": (lambda modif_str: AddedNote(int(modif_str))),
+        "sus": (lambda modif_str: Suspended(int(modif_str[3:]))),
+        "alt": _parse_altered_modifier,
+        "bass": (lambda modif_str: BassNote(modif_str[1:])),
+    }
 
+    @functools.lru_cache(maxsize=2048)
     def parse(self, chord_str: str) -> Chord:
+        # The same chord strings recur many times across a songbook; caching makes repeat
+        # occurrences a dict hit instead of a regex run. Safe because Chord is immutable after parse.
         if not chord_str:
             raise SongParseError("empty chord")
         root = self.tone_pattern.match(chord_str)
         if root is None:
             raise SongParseError(f"invalid chord major: {chord_str}")
-        modifiers = list(self.parse_modifiers(chord_str[root.end() :]))
-        return Chord(root.group(), modifiers=modifiers)
+        modifiers = tuple(self.parse_modifiers(chord_str[root.end() :]))
+        # Intern the root: there are only ~21 possible tone strings, so downstream comparisons
+        # and dict lookups become pointer checks and hash hits on shared objects.
+        return Chord(sys.intern(root.group()), modifiers=modifiers)
 
     def parse_modifiers(self, modif_str: str) -> Generator[ChordModifier, None, None]:
-        while modif_str:
-            for pattern, converter, pass_match in self.modifier_patterns:
-                match = pattern.match(modif_str)
-                if match is not None:
-                    yield converter(match) if pass_match else converter()
-                    modif_str = modif_str[len(match.group()) :]
-                    break
-            else:
-                yield GenericChordModifier(modif_str)
+        common = self.common_modifier_strings.get(modif_str)
+        if common is not None:
+            yield from common
+            return
+        pos = 0
+        while pos < len(modif_str):
+            match = self.modifier_pattern.match(modif_str, pos)
+            if match is None:
+                yield GenericChordModifier(modif_str[pos:])
                 return
+            yield self.modifier_converters[match.lastgroup](match.group())
+            pos = match.end()
 
 
 class ModifiedSongsLatexChordParser(ChordParser):
-    substitutions: list[tuple[re.Pattern, str | Callable[[re.Match], str]]] = [
-        (re.compile(r"\\shrp(\{})?"), "#"),
-        (re.compile(r"\\hidx\{([^}\]]+)}"), lambda m: m.group(1)),
-        (re.compile(r"\\didx\{([^}\]]+)}"), lambda m: m.group(1)),
-    ]
+    # Sharp marks and index braces unwrapped in a single fused scan instead of one sub per command.
+    substitution_pattern: re.Pattern = re.compile(r"\\shrp(?:\{})?|\\(?:hidx|didx)\{([^}\]]+)}")
 
     def __init__(self):
         self.inner = DefaultChordParser()
 
+    @functools.lru_cache(maxsize=2048)
     def parse(self, chord_str: str) -> Chord:
-        sub_chord_str = chord_str
-        for pattern, sub in self.substitutions:
-            sub_chord_str = pattern.sub(sub, sub_chord_str)
-        parsed = self.inner.parse(sub_chord_str)
-        return parsed
+        if "\\" not in chord_str:  # no LaTeX commands, nothing to substitute
+            return self.inner.parse(chord_str)
+        sub_chord_str = self.substitution_pattern.sub(lambda m: m.group(1) or "#", chord_str)
+        return self.inner.parse(sub_chord_str)
 
 
 class DefaultFormat(SongFormat):
@@ -161,60 +207,74 @@ class DefaultFormat(SongFormat):
     default_annotation_delimiter: str = ": "
     chord_start_mark: str = "["
     chord_end_mark: str = "]"
+    chord_segment_pattern: re.Pattern = re.compile(
+        re.escape(chord_start_mark)
+        + r"([^" + re.escape(chord_start_mark + chord_end_mark) + r"]*)"
+        + re.escape(chord_end_mark)
+        + r"([^" + re.escape(chord_start_mark) + r"]*)"
+    )
 
     chord_parser: DefaultChordParser = DefaultChordParser()
     part_separator_pattern: re.Pattern = re.compile(r"\n\s*\n")
-    whitespace_normalizers: list[tuple[re.Pattern, str]] = [
-        (re.compile(r"\s*\n\s*"), "\n"),  # remove all space around newlines
-        (re.compile(r"[^\S\r\n]+"), " "),  # change all space except newline to a single space
-    ]
+    # Common ASCII blanks are first mapped to plain spaces by a C-level translate, so the normalizer
+    # regex handles newline surroundings, multi-blank runs, and the rare exotic single blanks (NBSP
+    # and friends, anything [^\S\r\n] matches); single plain spaces (the overwhelmingly common case)
+    # never trigger the substitution callback at all.
+    whitespace_translation: dict[int, str] = str.maketrans("\t\f\v", "   ")
+    whitespace_normalizer_pattern: re.Pattern = re.compile(r"(\s*\n\s*)|[^\S\r\n]{2,}|[^ \S\r\n]")
     heading_markers: list[str] = [default_heading_marker, ": "]
-    strophe_mark_delimiters: list[str] = [default_strophe_mark_delimiter, ":"]
+    strophe_mark_delimiter_chars: str = default_strophe_mark_delimiter + ":"
     direct_strophe_marks: dict[str, Type[StropheMark]] = {
         "R": ChorusMark,
         # "C": CodaMark,  # coda recognition is done by normalization in the model
     }
-    strophe_mark_patterns: list[tuple[re.Pattern, Type[StropheMark]]] = [
-        (re.compile(r"\d+"), NumberedStropheMark),
-        (re.compile(r"[A-E]+"), LetteredStropheMark),
-    ]
+    strophe_mark_dispatch: dict[str, Type[StropheMark]] = {char: NumberedStropheMark for char in "0123456789"} | {
+        char: LetteredStropheMark for char in "ABCDE"
+    }
 
     untitled_title: str = "<Untitled>"
     heading_indent: int = 8
     annotation_indent: int = 5
+    heading_pad: str = " " * heading_indent
+    annotation_pad: str = " " * annotation_indent
 
     def loads(self, song_text: str) -> Song:
+        # Parts are consumed lazily from a single separator scan; each part is then touched only
+        # by its own parser, so no intermediate part list is materialized.
         parts = self._split_song_parts(song_text)
-        init_annot_part_i = 0
-        if "\n" not in parts[0]:
-            annotations = self._try_parse_heading(parts[0])
-            if annotations:
-                init_annot_part_i = 1
-        else:
-            annotations = []
-        if len(parts) <= init_annot_part_i:
+        first_part = next(parts, None)
+        if first_part is None:
             raise SongParseError("empty song: no song body found")
-        init_annotations = self._try_parse_annotations(parts[init_annot_part_i])
+        annotations: list[Annotation] = []
+        if "\n" not in first_part:
+            annotations = self._try_parse_heading(first_part)
+            if annotations:
+                first_part = next(parts, None)
+                if first_part is None:
+                    raise SongParseError("empty song: no song body found")
+        init_annotations = self._try_parse_annotations(first_part)
         if init_annotations:
             annotations.extend(init_annotations)
-            first_item_i = init_annot_part_i + 1
-        else:
-            first_item_i = init_annot_part_i
-        items = []
-        for part in parts[first_item_i:]:
+            first_part = next(parts, None)
+        items: list[Strophe | Annotation] = []
+        for part in (parts if first_part is None else itertools.chain([first_part], parts)):
             some_annotations = self._try_parse_annotations(part, initial=False)
             if some_annotations:
-                items.extend(annotations)
+                items.extend(some_annotations)
             else:
                 items.append(self._parse_strophe(part))
         return Song(annotations=annotations, items=items)
 
-    def _split_song_parts(self, song_text: str) -> list[str]:
-        return [
-            part.rstrip().lstrip("\n")
-            for part in self.part_separator_pattern.split(song_text)
-            if part and not part.isspace()
-        ]
+    def _split_song_parts(self, song_text: str) -> Generator[str, None, None]:
+        pos = 0
+        for match in self.part_separator_pattern.finditer(song_text):
+            part = song_text[pos:match.start()]
+            if part and not part.isspace():
+                yield part.rstrip().lstrip("\n")
+            pos = match.end()
+        part = song_text[pos:]
+        if part and not part.isspace():
+            yield part.rstrip().lstrip("\n")
 
     def _try_parse_heading(self, line: str) -> list[Annotation]:
         for marker in self.heading_markers:
@@ -230,57 +290,80 @@ class DefaultFormat(SongFormat):
 
     def _parse_strophe(self, part: str) -> Strophe:
         mark, body = self._parse_strophe_mark(part)
-        pieces = self._normalize_strophe_whitespace(body).split(self.chord_start_mark)
-        segments: list[StropheSegment] = [PlainSegment(pieces[0])] if pieces[0] else []
-        for piece in pieces[1:]:
-            if self.chord_end_mark not in piece:
+        body = self._normalize_strophe_whitespace(body)
+        first_chord_i = body.find(self.chord_start_mark)
+        if first_chord_i == -1:
+            return Strophe(mark=mark, segments=([PlainSegment(body)] if body else []))
+        segments: list[StropheSegment] = [PlainSegment(body[:first_chord_i])] if first_chord_i else []
+        pos = first_chord_i
+        parse_chord = self.chord_parser.parse  # bound once for the per-segment loop
+        for match in self.chord_segment_pattern.finditer(body, first_chord_i):
+            if match.start() != pos:
                 raise SongParseError("mismatched chord start/end marks")  # todo better info on where it occurred
-            chord_str, text_str = piece.split(self.chord_end_mark, maxsplit=1)
-            segments.append(ChordedSegment(chord=self.chord_parser.parse(chord_str), text=text_str))
+            segments.append(ChordedSegment(chord=parse_chord(match.group(1)), text=match.group(2)))
+            pos = match.end()
+        if pos != len(body):
+            raise SongParseError("mismatched chord start/end marks")
         return Strophe(mark=mark, segments=segments)
 
     def _parse_strophe_mark(self, part: str) -> tuple[StropheMark, str]:
         strip_part = part.strip()
         init, rest = strip_part.split(maxsplit=1)
-        for delim in self.strophe_mark_delimiters:
-            init = init.removesuffix(delim)
+        if init and init[-1] in self.strophe_mark_delimiter_chars:
+            init = init[:-1]
         direct_mark_type = self.direct_strophe_marks.get(init)
         if direct_mark_type is not None:
             return direct_mark_type.from_string(init), rest
-        for mark_re, mark_type in self.strophe_mark_patterns:
-            if mark_re.fullmatch(init):
+        mark_type = self.strophe_mark_dispatch.get(init[:1])
+        if mark_type is not None:
+            try:
                 return mark_type.from_string(init), rest
+            except ValueError:
+                pass  # first character looked like a mark but the rest does not fit: markless strophe
         return EmptyStropheMark(), part
 
     def _normalize_strophe_whitespace(self, body: str) -> str:
-        for pattern, repl in self.whitespace_normalizers:
-            body = pattern.sub(repl, body)
-        return body.strip()
+        body = body.translate(self.whitespace_translation)
+        return self.whitespace_normalizer_pattern.sub(lambda m: "\n" if m.group(1) else " ", body).strip()
 
     def dumps(self, song: Song, indent: int | None = None, chords: bool = True) -> str:
-        header = f"\n{self.dump_heading(song)}\n\n"
+        # Collect all fragments and join once at the end instead of repeated str concatenation.
+        parts = ["\n", self.dump_heading(song), "\n\n"]
         other_annots = self.dump_annotations(song, chords=chords)
         if other_annots:
-            header += f"{other_annots}\n\n"
-        body = "\n\n".join(self.dump_song_items(song, indent=indent, chords=chords))
-        return header + body
+            parts += [other_annots, "\n\n"]
+        for i, item_str in enumerate(self.dump_song_items(song, indent=indent, chords=chords)):
+            if i:
+                parts.append("\n\n")
+            parts.append(item_str)
+        return "".join(parts)
 
     def dump_heading(self, song: Song) -> str:
-        authors = ", ".join(annot.name for annot in song.get_annotations_of_type(AuthorAnnotation))
-        title = song.get_title() or self.untitled_title
+        # Collect authors and title in one pass over the annotations.
+        author_names: list[str] = []
+        titles: list[str] = []
+        for annot in song.annotations:
+            if isinstance(annot, AuthorAnnotation):
+                author_names.append(annot.name)
+            elif isinstance(annot, TitleAnnotation):
+                titles.append(annot.title)
+        if len(titles) > 1:
+            raise MalformedSongError("multiple song titles")
+        authors = ", ".join(author_names)
+        title = titles[0] if titles else self.untitled_title
         if authors:
-            return " " * self.heading_indent + authors + self.default_heading_marker + title
+            return self.heading_pad + authors + self.default_heading_marker + title
         else:
-            return " " * self.heading_indent + title
+            return self.heading_pad + title
 
     def dump_annotations(self, song: Song, chords: bool = True) -> str:
         rem_annots = song.get_displayable_annotations(chords=chords)
         if not rem_annots:
             return ""
-        return "\n".join(self.dump_annotation(annot) for annot in rem_annots)
+        return "\n".join([self.dump_annotation(annot) for annot in rem_annots])
 
     def dump_annotation(self, annot: Annotation) -> str:
-        return " " * self.annotation_indent + annot.to_string(delimiter=self.default_annotation_delimiter)
+        return self.annotation_pad + annot.to_string(delimiter=self.default_annotation_delimiter)
 
     def dump_song_items(self, song: Song, indent: int | None = None, chords: bool = True) -> Generator[str, None, None]:
         if indent is None:
@@ -300,8 +383,8 @@ class DefaultFormat(SongFormat):
 
     def dump_strophe(self, strophe: Strophe, indent: int = 0, chords: bool = True) -> str:
         init = self.dump_strophe_mark(strophe.mark, indent=indent)
-        indenter = " " * indent
-        raw_body = "".join(self.dump_segment(seg, chords=chords) for seg in strophe.single_line_segments())
+        indenter = _spaces(indent)
+        raw_body = "".join([self.dump_segment(seg, chords=chords) for seg in strophe.single_line_segments()])
         indented_body = init + raw_body.replace("\n", "\n" + indenter)
         return indented_body
 
@@ -309,7 +392,7 @@ class DefaultFormat(SongFormat):
         mark_str = mark.to_string(short=True)
         if mark_str:
             mark_str += self.default_strophe_mark_delimiter
-        init = mark_str + " " * max(1, indent - len(mark_str))
+        init = mark_str + _spaces(max(1, indent - len(mark_str)))
         return init
 
     def dump_segment(self, seg: StropheSegment, chords: bool = True) -> str:
@@ -329,32 +412,43 @@ class AgamaFormat(DefaultFormat):
 
     def dump_strophe(self, strophe: Strophe, indent: int = 0, chords: bool = True) -> str:
         init = self.dump_strophe_mark(strophe.mark, indent=indent)
-        indenter = " " * indent
+        indenter = _spaces(indent)
         dumped_segments = [self.dump_segment(seg, chords=chords) for seg in strophe.single_line_segments()]
-        raw_body = self._merge_lines(dumped_segments) if chords else "".join(dumped_segments)
-        if chords:
-            indented_body = indenter + raw_body.replace("\n", "\n" + indenter)
-            body_with_mark = self.empty_startline_pattern.sub(
-                "",
-                self.empty_line_pattern.sub("\n", indented_body.replace("\n" + indenter, "\n" + init, 1).strip("\n")),
-            )
-        else:
-            body_with_mark = init + raw_body.replace("\n", "\n" + indenter)
-        return body_with_mark
+        if not chords:
+            return init + "".join(dumped_segments).replace("\n", "\n" + indenter)
+        # One line-oriented pass: the first lyric line carries the strophe mark, all other lines the
+        # plain indent; blank (e.g. chordless chord) lines are dropped along the way.
+        out_lines: list[str] = []
+        for i, line in enumerate(self._merge_lines(dumped_segments).split("\n")):
+            prefixed = (init if i == 1 else indenter) + line
+            if not prefixed.strip():
+                continue
+            out_lines.append(prefixed)
+        return "\n".join(out_lines)
 
     def _merge_lines(self, dumped_segments: list[str]) -> str:
-        chord_lines = [[]]
-        main_lines = [[]]
+        # Single pass with flat part buffers flushed per line, instead of nested per-line lists
+        # joined pairwise at the end.
+        merged: list[str] = []
+        chord_parts: list[str] = []
+        main_parts: list[str] = []
         for dseg in dumped_segments:
-            chord_line, main_line = dseg.split("\n", maxsplit=1)
-            chord_lines[-1].append(chord_line)
-            main_lines[-1].append(main_line)
-            if main_line.endswith("\n"):
-                chord_lines[-1][-1] = chord_lines[-1][-1].rstrip() + "\n"
-                chord_lines.append([])
-                main_lines.append([])
-        chord_lines[-1][-1] = chord_lines[-1][-1].rstrip() + "\n"
-        return "".join("".join(line) for line_pair in zip(chord_lines, main_lines) for line in line_pair)
+            chord_part, main_part = dseg.split("\n", maxsplit=1)
+            chord_parts.append(chord_part)
+            main_parts.append(main_part)
+            if main_part.endswith("\n"):
+                chord_parts[-1] = chord_parts[-1].rstrip()
+                merged.extend(chord_parts)
+                merged.append("\n")
+                merged.extend(main_parts)
+                chord_parts = []
+                main_parts = []
+        if chord_parts:
+            chord_parts[-1] = chord_parts[-1].rstrip()
+            merged.extend(chord_parts)
+            merged.append("\n")
+            merged.extend(main_parts)
+        return "".join(merged)
 
     def dump_segment(self, seg: StropheSegment, chords: bool = True) -> str:
         if chords:
@@ -370,7 +464,7 @@ class AgamaFormat(DefaultFormat):
             return seg.text
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EmbeddedStrophe(StropheSegment):
     strophe: Strophe
 
@@ -388,7 +482,7 @@ class EmbeddedStrophe(StropheSegment):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RepeatCount(ProcessingInstruction):
     n_repeats: int
 
@@ -401,27 +495,35 @@ class ModifiedSongsLatexFormat(SongFormat):
     beginsong_pattern = re.compile(r"\s*\\beginsong\{(?P<title>[^}]+?)}(?:\[(?P<annots>[^]]+?)])?")
     beginsong_annot_pattern = re.compile(r"(?P<key>[a-z]+)=\{(?P<value>[^}]*?)}")
     beginsong_annot_keys = {"by": AuthorAnnotation}
-    simple_beginverse_commands: dict[str, Type[StropheMark]] = {
-        "emptyv": EmptyStropheMark,
-        "freev": EmptyStropheMark,
-        "chor": ChorusMark,
-        "intro": IntroMark,
-        "solo": SoloMark,
-        "bridge": BridgeMark,
-        "chorusi": functools.partial(NumberedChorusMark, number=1),
-        "chorusii": functools.partial(NumberedChorusMark, number=2),
-        "averse": functools.partial(LetteredStropheMark, letter="A"),
-        "bverse": functools.partial(LetteredStropheMark, letter="B"),
-        "cverse": functools.partial(LetteredStropheMark, letter="C"),
-        "recite": RecitationMark,
+    # Marks are immutable value types, so each command maps to one prebuilt shared instance
+    # instead of a factory to call per strophe.
+    simple_beginverse_marks: dict[str, StropheMark] = {
+        "emptyv": EmptyStropheMark(),
+        "freev": EmptyStropheMark(),
+        "chor": ChorusMark(),
+        "intro": IntroMark(),
+        "solo": SoloMark(),
+        "bridge": BridgeMark(),
+        "chorusi": NumberedChorusMark(number=1),
+        "chorusii": NumberedChorusMark(number=2),
+        "averse": LetteredStropheMark(letter="A"),
+        "bverse": LetteredStropheMark(letter="B"),
+        "cverse": LetteredStropheMark(letter="C"),
+        "recite": RecitationMark(),
     }
-    simple_beginverse_command_names = {v(): k for k, v in simple_beginverse_commands.items()}
+    simple_beginverse_command_names = {mark: command for command, mark in simple_beginverse_marks.items()}
     simple_beginverse_command_names[CodaMark()] = "cverse"
     numbered_beginverse_command = "num"
-    beginverse_commands = [numbered_beginverse_command] + list(simple_beginverse_commands.keys())
+    beginverse_commands = [numbered_beginverse_command] + list(simple_beginverse_marks.keys())
     endverse_commands = ["fin", "cl"]
-    strophe_split_pattern = re.compile(r"\\(?=(?:" + "|".join(beginverse_commands) + r")\b)")
-    endverse_pattern = re.compile(r"\\(?:" + "|".join(endverse_commands) + r")\b")
+    # Longest-first alternations so prefix-overlapping commands (chor/chorusi/chorusii) match
+    # without backtracking into the word-boundary check.
+    strophe_split_pattern = re.compile(
+        r"\\(?=(?:" + "|".join(map(re.escape, sorted(beginverse_commands, key=len, reverse=True))) + r")\b)"
+    )
+    endverse_pattern = re.compile(
+        r"\\(?:" + "|".join(map(re.escape, sorted(endverse_commands, key=len, reverse=True))) + r")\b"
+    )
     strophe_token_pattern = re.compile(r"([]\\[{}])")
     command_name_pattern = re.compile(r"\w+")
     whitespace_pattern = re.compile(r"\s+")
@@ -432,6 +534,9 @@ class ModifiedSongsLatexFormat(SongFormat):
         1: "\\hidx{{{}}}",
         -1: "\\didx{{{}}}",
     }
+    # Roots form a small closed set, so their TeX forms can be precomputed instead of
+    # scanning and reallocating the root string once per dumped chord.
+    root_tex_strings = {root: root.replace("#", "\\shrp{}") for root in get_args(Note)}
     simple_text_commands = {
         "chordson": [TurnChordsOn()],
         "chordsoff": [TurnChordsOff()],
@@ -446,6 +551,10 @@ class ModifiedSongsLatexFormat(SongFormat):
         "\n": "\\\\\n",
         "...": "\\ldots{}",
     }
+    # Replacement tables fused into one alternation each (longest key first), so text passes through
+    # a single scan instead of one str.replace walk per table entry.
+    text_load_repl_pattern = re.compile("|".join(re.escape(k) for k in sorted(text_load_repls, key=len, reverse=True)))
+    text_dump_repl_pattern = re.compile("|".join(re.escape(k) for k in sorted(text_dump_repls, key=len, reverse=True)))
     repcommands = {
         ChorusMark(): "repchorus",
         NumberedChorusMark(number=1): "repchorusi",
@@ -524,9 +633,9 @@ class ModifiedSongsLatexFormat(SongFormat):
         return strophes_and_annots
 
     def _skip_whitespace(self, text: str, pos: int) -> int:
-        whitespace_match = self.whitespace_pattern.match(text[pos:])
+        whitespace_match = self.whitespace_pattern.match(text, pos)
         if whitespace_match:
-            return pos + len(whitespace_match.group())
+            return whitespace_match.end()
         else:
             return pos
         # raise NotImplementedError
@@ -539,7 +648,7 @@ class ModifiedSongsLatexFormat(SongFormat):
         #     raise NotImplementedError(f"unknown annotation string: {annot_str}")
 
     def _parse_strophe(self, strophe_str: str, num: int, chords_on: bool) -> tuple[Strophe, list[Annotation]]:
-        mark_str = re.match(r"\w+", strophe_str).group()
+        mark_str = self.command_name_pattern.match(strophe_str).group()
         mark = self._parse_strophe_mark(mark_str, num=num)
         parts = self.endverse_pattern.split(strophe_str[len(mark_str):])
         if len(parts) != 2:
@@ -551,10 +660,10 @@ class ModifiedSongsLatexFormat(SongFormat):
     def _parse_strophe_mark(self, mark_str: str, num: int) -> StropheMark:
         if mark_str == self.numbered_beginverse_command:
             return NumberedStropheMark(num)
-        elif mark_str in self.simple_beginverse_commands:
-            return self.simple_beginverse_commands[mark_str]()
-        else:
+        mark = self.simple_beginverse_marks.get(mark_str)
+        if mark is None:
             raise SongParseError(f"unknown strophe mark command: {mark_str!r}")
+        return mark
 
     def _parse_strophe_segments(self, body: str, chords_on: bool) -> list[StropheSegment]:
         # STROPHE = STROPHE_PART+
@@ -566,30 +675,34 @@ class ModifiedSongsLatexFormat(SongFormat):
         # CHORD_CHUNK = CHORD_MARK CURLY_PARS?
         # TEXT_CHUNK = "[^[]{}\]"
         # CHORD_MARK = "\[" "[^]]" "]"
-        strophe_segments = []
+        strophe_segments: list[StropheSegment] = []
+        # Hoist the bound method, extend and length out of the dispatch loop; this runs once per
+        # strophe part and the attribute lookups add up on long songbooks.
+        parse_part = self._parse_strophe_part
+        extend = strophe_segments.extend
+        body_len = len(body)
         current_pos = 0
-        while current_pos < len(body):
-            part_segments, current_pos = self._parse_strophe_part(body, pos=current_pos)
-            strophe_segments.extend(part_segments)
+        while current_pos < body_len:
+            part_segments, current_pos = parse_part(body, pos=current_pos)
+            extend(part_segments)
         return self._join_strophe_segments(strophe_segments, chords_on=chords_on)
 
     @staticmethod
     def _join_strophe_segments(segments: list[StropheSegment], chords_on: bool) -> list[StropheSegment]:
-        seg_i = 0
+        # Forward pass building the output list; the previous in-place variant popped merged
+        # segments out of the list, which is quadratic on segment-dense strophes.
+        joined: list[StropheSegment] = []
         current_chords_on = chords_on
-        while seg_i < len(segments):
-            if isinstance(segments[seg_i], TurnChordsOn):
+        for seg in segments:
+            if isinstance(seg, TurnChordsOn):
                 current_chords_on = True
-                segments.pop(seg_i)
-            elif isinstance(segments[seg_i], TurnChordsOff):
+            elif isinstance(seg, TurnChordsOff):
                 current_chords_on = False
-                segments.pop(seg_i)
-            elif current_chords_on and isinstance(segments[seg_i], PlainSegment) and seg_i > 0 and isinstance(segments[seg_i-1], ChordedSegment):
-                segments[seg_i - 1].text += segments[seg_i].text
-                segments.pop(seg_i)
+            elif current_chords_on and isinstance(seg, PlainSegment) and joined and isinstance(joined[-1], ChordedSegment):
+                joined[-1].text += seg.text
             else:
-                seg_i += 1
-        return segments
+                joined.append(seg)
+        return joined
 
     def _parse_strophe_part(self, text: str, pos: int) -> tuple[list[StropheSegment], int]:
         if text[pos] == "\\":
@@ -605,17 +718,17 @@ class ModifiedSongsLatexFormat(SongFormat):
         pos += 1
         if text[pos] == "\\":
             return [], pos + 1  # newline command is no-op
-        command_name_match = self.command_name_pattern.match(text[pos:])
+        command_name_match = self.command_name_pattern.match(text, pos)
         if not command_name_match:
             raise PositionalSongParseError("expecting command name", text, pos)
         command_name = command_name_match.group()
-        post_command_name_pos = pos + len(command_name)
+        post_command_name_pos = command_name_match.end()
         if post_command_name_pos < len(text) and text[post_command_name_pos] == "{":
             inner, after_pos = self._parse_curly_parens(text, post_command_name_pos)
         else:
             inner = []
             # skip whitespace after command name if no braces present
-            after_pos = post_command_name_pos + (len(text[post_command_name_pos:]) - len(text[post_command_name_pos:].lstrip()))
+            after_pos = self._skip_whitespace(text, post_command_name_pos)
         if command_name in self.simple_text_commands:
             if inner:
                 raise PositionalSongParseError("nonempty contents of simple command", text, pos)
@@ -641,18 +754,17 @@ class ModifiedSongsLatexFormat(SongFormat):
         return segments, after_plain_pos
 
     def _parse_text_chunk(self, text: str, pos: int) -> tuple[PlainSegment | None, int]:
-        split_result = self.strophe_token_pattern.split(text[pos:], maxsplit=1)
-        if len(split_result) == 1:  # no more token splitters, all the rest is plain
+        # Search from the offset instead of splitting a tail copy; the old per-position
+        # split(text[pos:]) allocated O(n) bytes per call, making long strophes quadratic.
+        match = self.strophe_token_pattern.search(text, pos)
+        if match is None:  # no more token splitters, all the rest is plain
             return self._handle_parsed_text(text[pos:]), len(text)
-        pretoken, token, posttoken = split_result
-        if pretoken:
-            return self._handle_parsed_text(pretoken), pos + len(pretoken)
+        if match.start() > pos:
+            return self._handle_parsed_text(text[pos:match.start()]), match.start()
         return None, pos
 
     def _handle_parsed_text(self, parsed: str) -> PlainSegment:
-        for pat, sub in self.text_load_repls.items():
-            parsed = parsed.replace(pat, sub)
-        return PlainSegment(parsed)
+        return PlainSegment(self.text_load_repl_pattern.sub(lambda m: self.text_load_repls[m.group()], parsed))
 
     def _parse_chord_chunk(self, text: str, pos: int) -> tuple[StropheSegment, int]:
         chord, after_chord_pos = self._parse_chord_mark(text, pos)
@@ -678,14 +790,14 @@ class ModifiedSongsLatexFormat(SongFormat):
         return inner_segments, current_pos + 1
 
     def _parse_chord_mark(self, text: str, pos: int) -> tuple[Chord, int]:
-        if not text[pos:].startswith("\\["):
-            raise PositionalSongParseError("expecting chord start (\[)", text, pos)
+        if not text.startswith("\\[", pos):
+            raise PositionalSongParseError("expecting chord start (\\[)", text, pos)
         pos += 2
-        next_ending = text[pos:].find("]")  # TODO turn into a param
+        next_ending = text.find("]", pos)  # TODO turn into a param
         if next_ending == -1:
             raise PositionalSongParseError("unterminated chord", text, pos)
-        chord = self.chord_parser.parse(text[pos:pos+next_ending])
-        return chord, pos + next_ending + 1
+        chord = self.chord_parser.parse(text[pos:next_ending])
+        return chord, next_ending + 1
 
     @staticmethod
     def _parse_repchorus(segs: list[StropheSegment | ProcessingInstruction], n: int | None) -> list[EmbeddedStrophe]:
@@ -707,6 +819,17 @@ class ModifiedSongsLatexFormat(SongFormat):
         "repchorusii": functools.partial(_parse_repchorus, n=2),
     }
 
+    # Concrete item types occurring in parsed songs; dump_song_items checks type() identity
+    # against these and only falls back to isinstance for unknown subclasses.
+    annotation_item_types: ClassVar[frozenset[type]] = frozenset(
+        {AuthorAnnotation, TitleAnnotation, GenericAnnotation, TurnChordsOn, TurnChordsOff}
+    )
+    known_item_types: ClassVar[frozenset[type]] = annotation_item_types | {
+        Strophe,
+        RepeatStropheWithSameMark,
+        StropheRepeat,
+    }
+
     def dumps(self, song: Song, chords: bool = True) -> str:
         parts = [self.dump_beginsong(song)]
         annot_part = self.dump_annotations(song, chords=chords)
@@ -724,24 +847,43 @@ class ModifiedSongsLatexFormat(SongFormat):
         rem_annots = song.get_displayable_annotations(chords=chords)
         if not rem_annots:
             return ""
-        return "\n".join(self.dump_annotation(annot) for annot in rem_annots)
+        return "\n".join([self.dump_annotation(annot) for annot in rem_annots])
 
     def dump_annotation(self, annot: Annotation) -> str:
         raise NotImplementedError
 
-    def dump_song_items(self, song: Song, chords: bool) -> Generator[str, None, None]:
-        accummulated_repeats = []
-        for i, item in enumerate(song.items):
-            if isinstance(item, Annotation) and (chords or not item.is_chord_annotation):
-                yield self.dump_annotation(item)
-            elif isinstance(item, StropheRepeat):
-                accummulated_repeats.append(item)
-                print(i, item, len(song.items))
-                if i + 1 == len(song.items) or not isinstance(song.items[i+1], StropheRepeat) or song.items[i+1].repeated_strophe != item.repeated_strophe:
-                    yield self.dump_strophe_repeat(accummulated_repeats[0], chords=chords, n=len(accummulated_repeats))
-                    accummulated_repeats = []
+    def dump_song_items(self, song: Song, chords: bool) -> list[str]:
+        # Single forward pass: consecutive repeats of the same strophe are counted and flushed as
+        # one repeat command, without indexed lookahead into the item list. Returns a list rather
+        # than a generator since the only consumer materializes the items anyway.
+        parts: list[str] = []
+        pending_repeat: StropheRepeat | None = None
+        pending_count = 0
+        annotation_types = self.annotation_item_types
+        known_types = self.known_item_types
+        for item in song.items:
+            item_type = type(item)
+            if item_type is StropheRepeat or (item_type not in known_types and isinstance(item, StropheRepeat)):
+                if pending_repeat is not None and item.repeated_strophe == pending_repeat.repeated_strophe:
+                    pending_count += 1
+                else:
+                    if pending_repeat is not None:
+                        parts.append(self.dump_strophe_repeat(pending_repeat, chords=chords, n=pending_count))
+                    pending_repeat = item
+                    pending_count = 1
+                continue
+            if pending_repeat is not None:
+                parts.append(self.dump_strophe_repeat(pending_repeat, chords=chords, n=pending_count))
+                pending_repeat = None
+            if (
+                item_type in annotation_types or (item_type not in known_types and isinstance(item, Annotation))
+            ) and (chords or not item.is_chord_annotation):
+                parts.append(self.dump_annotation(item))
             else:
-                yield self.dump_strophe(item, chords=chords)
+                parts.append(self.dump_strophe(item, chords=chords))
+        if pending_repeat is not None:
+            parts.append(self.dump_strophe_repeat(pending_repeat, chords=chords, n=pending_count))
+        return parts
 
     def dump_strophe(self, strophe: Strophe, chords: bool) -> str:
         if isinstance(strophe, RepeatStropheWithSameMark):
@@ -759,7 +901,9 @@ class ModifiedSongsLatexFormat(SongFormat):
         return "\n".join(parts)
 
     def dump_strophe_repeat(self, strophe: StropheRepeat, chords: bool, n: int = 1) -> str:
-        if strophe.segments != strophe.repeated_strophe.segments:
+        # Unmodified repeats share the segment list object outright, so identity settles the
+        # common case without elementwise dataclass comparison.
+        if strophe.segments is not strophe.repeated_strophe.segments and strophe.segments != strophe.repeated_strophe.segments:
             raise NotImplementedError("cannot dump strophe repeats with modifications")
         _ = chords
         repcommand = self.repcommands[strophe.mark]
@@ -780,33 +924,65 @@ class ModifiedSongsLatexFormat(SongFormat):
             raise ValueError(f"cannot serialize {mark}")
 
     def dump_segments(self, segments: list[StropheSegment], chords: bool) -> str:
+        # Dispatch on the concrete segment type through a dict instead of re-running the
+        # isinstance cascade (and its MRO walks) for every segment and its predecessor.
+        handlers = self._segment_handlers()
         dumped = []
-        prev_seg = None
+        prev_type: type | None = None
         if chords and segments and isinstance(segments[0], ChordedSegment):
             dumped.append("\\chordson\n")
         for seg in segments:
-            if isinstance(seg, ChordedSegment) and chords:
-                if isinstance(prev_seg, PlainSegment):
-                    dumped.append("\n\\chordson\n")
-                dumped_chord = self.dump_chord(seg.chord)
-                dumped.append(f"\\[{dumped_chord}]")
-                if seg.text and not seg.text.isspace():
-                    if "\n" in seg.text:
-                        first_line, other_lines = seg.text.split("\n", maxsplit=1)
-                        if first_line:
-                            dumped.append(self._dump_chorded_text(first_line, len(dumped_chord)))
-                            dumped.append("\\\\\n")
-                        dumped.append(self.dump_text(other_lines))
-                    else:
-                        dumped.append(self._dump_chorded_text(seg.text, len(dumped_chord)))
-            elif isinstance(seg, PlainSegment) or (isinstance(seg, ChordedSegment) and not chords):
-                if chords and isinstance(prev_seg, ChordedSegment):
-                    dumped.append("\n\\chordsoff\n")
-                dumped.append(self.dump_text(seg.text))
+            handler = handlers.get(type(seg))
+            if handler is None:  # subclasses of the known segment types
+                if isinstance(seg, ChordedSegment):
+                    handler = self._dump_chorded_segment
+                elif isinstance(seg, PlainSegment):
+                    handler = self._dump_plain_segment
+                else:
+                    raise ValueError(f"unknown segment type: {seg}")
+            handler(seg, prev_type, chords, dumped)
+            prev_type = type(seg)
+        return "".join(dumped)
+
+    def _segment_handlers(self) -> dict[type, Callable[[StropheSegment, type | None, bool, list[str]], None]]:
+        handlers = getattr(self, "_seg_handlers", None)
+        if handlers is None:
+            handlers = {
+                PlainSegment: self._dump_plain_segment,
+                ChordedSegment: self._dump_chorded_segment,
+            }
+            self._seg_handlers = handlers
+        return handlers
+
+    def _dump_chorded_segment(self, seg: ChordedSegment, prev_type: type | None, chords: bool, dumped: list[str]) -> None:
+        if not chords:
+            self._dump_plain_segment(seg, prev_type, chords, dumped)
+            return
+        if prev_type is not None and not issubclass(prev_type, ChordedSegment):
+            # Start the switch on a fresh line only if one is not already open; this keeps the
+            # joined output clean without a whole-string newline-collapsing post-pass.
+            dumped.append("\\chordson\n" if dumped and dumped[-1].endswith("\n") else "\n\\chordson\n")
+        dumped_chord = self.dump_chord(seg.chord)
+        dumped.append(f"\\[{dumped_chord}]")
+        if seg.text and not seg.text.isspace():
+            # partition scans the text once, replacing the "\n" in + split double scan
+            first_line, newline, other_lines = seg.text.partition("\n")
+            if newline:
+                if first_line:
+                    dumped.append(self._dump_chorded_text(first_line, len(dumped_chord)))
+                    dumped.append("\\\\\n")
+                dumped_rest = self.dump_text(other_lines)
+                if dumped_rest:
+                    dumped.append(dumped_rest)
             else:
-                raise ValueError(f"unknown segment type: {seg}")
-            prev_seg = seg
-        return "".join(dumped).replace("\n\n", "\n")
+                dumped.append(self._dump_chorded_text(seg.text, len(dumped_chord)))
+
+    def _dump_plain_segment(self, seg: StropheSegment, prev_type: type | None, chords: bool, dumped: list[str]) -> None:
+        if chords and prev_type is not None and issubclass(prev_type, ChordedSegment):
+            dumped.append("\\chordsoff\n" if dumped and dumped[-1].endswith("\n") else "\n\\chordsoff\n")
+        dumped_text = self.dump_text(seg.text)
+        if dumped_text:  # empty fragments would confuse the ends-with-newline check above
+            dumped.append(dumped_text)
 
     def _dump_chorded_text(self, text: str, chord_length: int) -> str:
         dumped_text = self.dump_text(text)
@@ -817,25 +993,19 @@ class ModifiedSongsLatexFormat(SongFormat):
         return "{" + noendspaced_text + "}" + tail
 
     def dump_chord(self, chord: Chord) -> str:
-        modif_groups = []
-        for i, modif in enumerate(chord.modifiers):
-            if modif_groups and modif.level == modif_groups[-1][0]:
-                modif_groups[-1][1].append(modif.to_string())
-            else:
-                modif_groups.append((modif.level, [modif.to_string()]))
-        dumped = [chord.root.replace("#", "\\shrp{}")]
-        for level, group in modif_groups:
-            dumped_group = "".join(group)
-            dumped.append(self.chord_level_commands[level].format(dumped_group))
+        root = chord.root
+        dumped = [self.root_tex_strings.get(root) or root.replace("#", "\\shrp{}")]
+        for level, group in itertools.groupby(
+            zip(chord.modifier_levels, chord.modifier_strings), key=lambda pair: pair[0]
+        ):
+            dumped.append(self.chord_level_commands[level].format("".join(string for _, string in group)))
         return "".join(dumped)
 
     def dump_text(self, some_text: str) -> str:
         if '"' in some_text:
             warnings.warn(f"double quotes not typographically converted in {some_text}", category=SongSerializationWarning)
             # TODO handle double quotes using \uv
-        for pat, sub in self.text_dump_repls.items():
-            some_text = some_text.replace(pat, sub)
-        return some_text
+        return self.text_dump_repl_pattern.sub(lambda m: self.text_dump_repls[m.group()], some_text)
 
 
 class ModelDictFormat(SongFormat):
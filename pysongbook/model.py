@@ -1,6 +1,6 @@
 import abc
 import collections
-import copy
+import itertools
 from abc import ABC
 import dataclasses
 from typing import ClassVar, Literal, Type, TypeVar
@@ -15,6 +15,10 @@ class MalformedSongError(ValueError):
 
 
 class StropheSegment(ABC):
+    # The slot backs the subclasses' splitlines memo. It is hand-declared here instead of being a
+    # dataclass field on them so that dataclasses.asdict() (the dict/JSON dump) never sees it.
+    __slots__ = ("_splitlines_cache",)
+
     @abc.abstractmethod
     def __add__(self, other: str):
         raise NotImplementedError
@@ -33,25 +37,43 @@ class StropheSegment(ABC):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PlainSegment(StropheSegment):
     text: str = ""  # needs default value to override abstract property
 
     def __add__(self, other: str) -> "PlainSegment":
+        if not other:  # nothing to append, no need for a fresh instance
+            return self
         return PlainSegment(text=self.text + other)
 
     def __sub__(self, other: str) -> "PlainSegment":
+        if not other or not self.text.endswith(other):  # nothing to strip
+            return self
         return PlainSegment(text=self.text.removesuffix(other))
 
     def splitlines(self) -> list["PlainSegment"]:
-        text_chunks = self.text.split("\n")
-        segments = [PlainSegment(chunk + "\n") for chunk in text_chunks[:-1]]
-        if text_chunks[-1]:
-            segments.append(PlainSegment(text_chunks[-1]))
+        # Segments are effectively immutable after construction (edits go through __add__/__sub__,
+        # which return fresh instances), so the split only needs to be computed once.
+        try:
+            return self._splitlines_cache
+        except AttributeError:
+            pass
+        if self.text and "\n" not in self.text:  # single-line fast path; empty text must still yield []
+            segments = [self]
+        else:
+            text_chunks = self.text.split("\n")
+            segments = [PlainSegment(chunk + "\n") for chunk in text_chunks[:-1]]
+            if text_chunks[-1]:
+                segments.append(PlainSegment(text_chunks[-1]))
+        self._splitlines_cache = segments
         return segments
 
 
 class ChordModifier(ABC):
+    # The slot backs the subclasses' rendered-once string form. Hand-declared here instead of as a
+    # dataclass field on them so that dataclasses.asdict() (the dict/JSON dump) never sees it.
+    __slots__ = ("_string",)
+
     @property
     @abc.abstractmethod
     def level(self) -> str:
@@ -62,7 +84,7 @@ class ChordModifier(ABC):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Minor(ChordModifier):
     level: ClassVar[int] = 0
 
@@ -70,7 +92,7 @@ class Minor(ChordModifier):
         return "m"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DominantSeventh(ChordModifier):
     level: ClassVar[int] = 1
 
@@ -78,7 +100,7 @@ class DominantSeventh(ChordModifier):
         return "7"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MajorSeventh(ChordModifier):
     level: ClassVar[int] = 1
 
@@ -86,44 +108,58 @@ class MajorSeventh(ChordModifier):
         return "maj7"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AddedNote(ChordModifier):
     factor: int
     level: ClassVar[int] = 1
 
+    # Modifiers are treated as immutable (and shared) after parse, so the string form
+    # can be rendered once instead of on every dump.
+    def __post_init__(self):
+        self._string = str(self.factor)
+
     def to_string(self) -> str:
-        return str(self.factor)
+        return self._string
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Suspended(ChordModifier):
     factor: int
     level: ClassVar[int] = 1
 
+    def __post_init__(self):
+        self._string = f"sus{self.factor}"
+
     def to_string(self) -> str:
-        return f"sus{self.factor}"
+        return self._string
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Altered(ChordModifier):
     direction: Literal["+", "dim"]
     factor: int = 5
     level: ClassVar[int] = 1
 
+    def __post_init__(self):
+        self._string = self.direction if self.factor == 5 else f"{self.direction}{self.factor}"
+
     def to_string(self) -> str:
-        return self.direction if self.factor == 5 else f"{self.direction}{self.factor}"
+        return self._string
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BassNote(ChordModifier):
     note: Note
     level: ClassVar[int] = 0
 
+    def __post_init__(self):
+        self._string = "/" + self.note
+
     def to_string(self) -> str:
-        return "/" + self.note
+        return self._string
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GenericChordModifier(ChordModifier):  # todo replace with meaningful ChordModifiers
     string: str
     level: ClassVar[int] = 1
@@ -132,34 +168,60 @@ class GenericChordModifier(ChordModifier):  # todo replace with meaningful Chord
         return self.string
 
 
-@dataclasses.dataclass
-class Chord:
+class _ChordCaches:
+    # Parallel per-modifier levels and rendered strings, precomputed so the dump paths can walk
+    # flat tuples instead of touching each modifier object again. Hand-declared slots rather than
+    # dataclass fields so that dataclasses.asdict() (the dict/JSON dump) never sees them.
+    __slots__ = ("modifier_levels", "modifier_strings")
+    modifier_levels: tuple[int, ...]
+    modifier_strings: tuple[str, ...]
+
+
+@dataclasses.dataclass(slots=True)
+class Chord(_ChordCaches):
     root: Note
-    modifiers: list[ChordModifier]
+    modifiers: tuple[ChordModifier, ...]  # tuple: chords are treated as immutable (and cached) after parse
+
+    def __post_init__(self):
+        self.modifier_levels = tuple(modif.level for modif in self.modifiers)
+        self.modifier_strings = tuple(modif.to_string() for modif in self.modifiers)
 
     def to_string(self) -> str:
-        return self.root + "".join(modif.to_string() for modif in self.modifiers)
+        return self.root + "".join(self.modifier_strings)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChordedSegment(StropheSegment):
     chord: Chord
     text: str = ""  # needs default value to override abstract property
 
     def __add__(self, other: str) -> "ChordedSegment":
+        if not other:  # nothing to append, no need for a fresh instance
+            return self
         return ChordedSegment(chord=self.chord, text=self.text + other)
 
     def __sub__(self, other: str) -> "ChordedSegment":
+        if not other or not self.text.endswith(other):  # nothing to strip
+            return self
         return ChordedSegment(chord=self.chord, text=self.text.removesuffix(other))
 
     def splitlines(self) -> list["ChordedSegment"]:
-        plain_split = PlainSegment(self.text).splitlines()
-        if not plain_split:
+        if "\n" not in self.text:  # single-line fast path (covers empty text, which yields [self] too)
             return [self]
-        return [self.__class__(chord=self.chord, text=plseg.text) for plseg in plain_split]
+        # Split the text directly instead of taking a detour through a throwaway PlainSegment;
+        # class and chord are hoisted and passed positionally to keep the per-line cost down.
+        cls = self.__class__
+        chord = self.chord
+        text_chunks = self.text.split("\n")
+        segments = [cls(chord, chunk + "\n") for chunk in text_chunks[:-1]]
+        if text_chunks[-1]:
+            segments.append(cls(chord, text_chunks[-1]))
+        return segments
 
 
 class StropheMark(ABC):
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def from_string(cls, mark: str) -> "StropheMark":
@@ -175,7 +237,7 @@ class StropheMark(ABC):
         raise NotImplementedError
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(eq=True, frozen=True, slots=True)
 class NumberedStropheMark(StropheMark):
     number: int
     is_chorus: ClassVar[bool] = False
@@ -188,14 +250,15 @@ class NumberedStropheMark(StropheMark):
         return str(self.number)
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(eq=True, frozen=True, slots=True)
 class LetteredStropheMark(StropheMark):
     letter: Literal["A", "B", "C", "D", "E"]
     is_chorus: ClassVar[bool] = False
+    valid_letters: ClassVar[frozenset[str]] = frozenset({"A", "B", "C", "D", "E"})
 
     @classmethod
     def from_string(cls, mark: str) -> "LetteredStropheMark":
-        if mark not in ["A", "B", "C", "D", "E"]:
+        if mark not in cls.valid_letters:
             raise ValueError("invalid lettered strophe mark")
         return cls(mark)
 
@@ -203,7 +266,7 @@ class LetteredStropheMark(StropheMark):
         return self.letter
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(eq=True, frozen=True, slots=True)
 class NumberedChorusMark(StropheMark):
     number: int
     is_chorus: ClassVar[bool] = True
@@ -216,8 +279,20 @@ class NumberedChorusMark(StropheMark):
         return f"R{self.number}" if short else f"Chorus {self.number}"
 
 
-@dataclasses.dataclass(eq=True, frozen=True)  # makes all instances of the same class equal (no attrs)
+@dataclasses.dataclass(eq=True, frozen=True, slots=True)  # makes all instances of the same class equal (no attrs)
 class InvariantStropheMark(StropheMark):
+    _instances: ClassVar[dict[type, "InvariantStropheMark"]] = {}
+
+    def __new__(cls) -> "InvariantStropheMark":
+        # Field-less and frozen, so a single shared instance per class suffices; mark-keyed
+        # dict lookups then hit the fast identity path instead of dataclass equality.
+        instance = cls._instances.get(cls)
+        if instance is None:
+            # object.__new__ instead of zero-arg super(): slots=True recreates the class,
+            # which would leave super()'s compile-time class cell pointing at the original.
+            instance = cls._instances[cls] = object.__new__(cls)
+        return instance
+
     @classmethod
     def from_string(cls, mark: str) -> "InvariantStropheMark":
         return cls()
@@ -276,7 +351,7 @@ class EmptyStropheMark(InvariantStropheMark):
         return ""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Strophe:
     mark: StropheMark
     segments: list[StropheSegment]
@@ -289,23 +364,23 @@ class RepeatStropheWithSameMark(Strophe):
     """A strophe that repeats some undefined previous strophe, to be determined by the strophe mark."""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StropheRepeat(Strophe):
     repeated_strophe: Strophe
 
+    # Custom init kept: the generated one would put the inherited mark/segments fields first,
+    # while a repeat is constructed from the repeated strophe alone. Copying the mark and
+    # segment list references instead of forwarding through properties makes StropheRepeat
+    # structurally identical to Strophe, with plain attribute loads.
     def __init__(self, repeated_strophe: Strophe):
         self.repeated_strophe = repeated_strophe
-
-    @property
-    def mark(self) -> StropheMark:
-        return self.repeated_strophe.mark
-
-    @property
-    def segments(self) -> list[StropheSegment]:
-        return self.repeated_strophe.segments  # TODO this brings up some trouble
+        self.mark = repeated_strophe.mark
+        self.segments = repeated_strophe.segments  # TODO this brings up some trouble
 
 
 class Annotation(ABC):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def is_chord_annotation(self) -> bool:
@@ -316,7 +391,7 @@ class Annotation(ABC):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, eq=False)
 class AuthorAnnotation(Annotation):
     name: str
     is_chord_annotation: ClassVar[bool] = False
@@ -325,7 +400,7 @@ class AuthorAnnotation(Annotation):
         return "Author" + delimiter + self.name
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, eq=False)
 class TitleAnnotation(Annotation):
     title: str
     is_chord_annotation: ClassVar[bool] = False
@@ -334,7 +409,7 @@ class TitleAnnotation(Annotation):
         return "Title" + delimiter + self.title
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, eq=False)
 class GenericAnnotation(Annotation):  # TODO this should be replaced by more specialized subclasses & left as fallback
     key: str
     value: str
@@ -347,91 +422,166 @@ class GenericAnnotation(Annotation):  # TODO this should be replaced by more spe
 A = TypeVar("A", bound=Annotation)
 
 
-@dataclasses.dataclass
-class Song:
+class _SongCaches:
+    # Derived caches, not part of the song model. Hand-declared slots rather than dataclass fields
+    # so that dataclasses.asdict() (the dict/JSON dump) never sees them.
+    __slots__ = ("_annot_index", "_displayable_annot_cache")
+    _annot_index: dict[type, list[Annotation]]
+    _displayable_annot_cache: dict[tuple, list[Annotation]]
+
+
+@dataclasses.dataclass(slots=True, eq=False)
+class Song(_SongCaches):
     annotations: list[Annotation]
     items: list[Strophe | Annotation]  # TODO allow only some annotations between strophes?
 
     def get_annotations_of_type(self, annot_type: Type[A]) -> list[A]:
-        return [annot for annot in self.annotations if isinstance(annot, annot_type)]
+        return self._annotation_index().get(annot_type, [])
+
+    def _annotation_index(self) -> dict[type, list[Annotation]]:
+        # Lazily bucket annotations by every class on their path to Annotation, so repeated typed
+        # lookups on the dump paths are dict hits instead of isinstance scans.
+        try:
+            return self._annot_index
+        except AttributeError:
+            pass
+        index = {}
+        for annot in self.annotations:
+            for klass in type(annot).__mro__:
+                index.setdefault(klass, []).append(annot)
+                if klass is Annotation:
+                    break
+        self._annot_index = index
+        return index
 
     def get_title(self) -> str | None:
-        titles = [annot.title for annot in self.get_annotations_of_type(TitleAnnotation)]
+        titles = self.get_annotations_of_type(TitleAnnotation)
         if not titles:
             return None
         elif len(titles) > 1:
             raise MalformedSongError("multiple song titles")
         else:
-            return titles[0]
+            return titles[0].title
 
     def get_displayable_annotations(
         self,
         exclude_types: frozenset[type[Annotation]] = frozenset([TitleAnnotation, AuthorAnnotation]),
         chords: bool = True,
     ) -> list[Annotation]:
-        return [
-            annot
-            for annot in self.annotations
-            if not isinstance(annot, tuple(exclude_types)) and (chords or not annot.is_chord_annotation)
-        ]
+        # Dumping a song typically asks for the same filtering repeatedly; cache per argument
+        # combination, relying on the annotation list not changing under our hands (as for
+        # _annotation_index).
+        try:
+            cache = self._displayable_annot_cache
+        except AttributeError:
+            cache = self._displayable_annot_cache = {}
+        key = (exclude_types, chords)
+        annots = cache.get(key)
+        if annots is None:
+            excluded = tuple(exclude_types)
+            annots = cache[key] = [
+                annot
+                for annot in self.annotations
+                if not isinstance(annot, excluded) and (chords or not annot.is_chord_annotation)
+            ]
+        return annots
 
     def normalized(self) -> "Song":
-        return Song(
-            annotations=copy.deepcopy(self.annotations),
-            items=self._fill_initial_plain_segments(self._recognize_codas(self._infer_chorus_repetition(self._link_strophe_repeats(copy.deepcopy(self.items))))),
-        )
+        items = self._infer_chorus_repetition(self._link_strophe_repeats(self._clone_items(self.items)))
+        # The remaining steps keep the item list structure intact, so a single strophe scan
+        # serves both instead of each refiltering the items on its own.
+        strophes = [(i, item) for i, item in enumerate(items) if isinstance(item, Strophe)]
+        items = self._recognize_codas(items, strophes)
+        items = self._fill_initial_plain_segments(items, strophes)
+        return Song(annotations=list(self.annotations), items=items)
+
+    @staticmethod
+    def _clone_items(items: list["Strophe | Annotation"]) -> list["Strophe | Annotation"]:
+        # Rebuild the strophes so normalization can safely replace their marks and segments
+        # in place, while sharing everything treated as immutable (marks, segments,
+        # annotations) with the original. Much cheaper than deepcopy's reflective dispatch.
+        cloned_items: list[Strophe | Annotation] = []
+        strophe_clones: dict[int, Strophe] = {}
+        for item in items:
+            if isinstance(item, StropheRepeat):
+                clone = strophe_clones.get(id(item.repeated_strophe))
+                cloned_items.append(StropheRepeat(repeated_strophe=clone if clone is not None else item.repeated_strophe))
+            elif isinstance(item, Strophe):
+                clone = type(item)(mark=item.mark, segments=list(item.segments))
+                strophe_clones[id(item)] = clone
+                cloned_items.append(clone)
+            else:
+                cloned_items.append(item)
+        return cloned_items
 
     @staticmethod
     def _link_strophe_repeats(items: list[Strophe | Annotation]) -> list[Strophe | Annotation]:
+        # Track the last strophe seen per mark while walking forward, so each repeat links in
+        # O(1) instead of searching back through the item list (marks are frozen, thus hashable).
         linked_items = []
-        for i, item in enumerate(items):
+        last_strophe_by_mark: dict[StropheMark, Strophe] = {}
+        for item in items:
             if isinstance(item, RepeatStropheWithSameMark):
                 if item.segments:
                     raise NotImplementedError("cannot link strophe repeats with modifications")
-                for j, link_item in reversed(list(enumerate(items[:i]))):
-                    if isinstance(link_item, Strophe) and link_item.mark == item.mark:
-                        linked_items.append(StropheRepeat(repeated_strophe=link_item))
-                        break
-                else:
+                link_item = last_strophe_by_mark.get(item.mark)
+                if link_item is None:
                     raise ValueError(f"cannot find strophe of mark {item.mark} to repeat")
+                linked_items.append(StropheRepeat(repeated_strophe=link_item))
             else:
+                if isinstance(item, Strophe):
+                    last_strophe_by_mark[item.mark] = item
                 linked_items.append(item)
         return linked_items
 
     @staticmethod
     def _infer_chorus_repetition(items: list[Strophe | Annotation]) -> list[Strophe | Annotation]:
-        strophe_types = [type(item.mark) for item in items if isinstance(item, Strophe)]
-        if len(strophe_types) <= 2 or len(strophe_types) < len(items):
+        if len(items) <= 2:
             return items
-        type_pattern = [NumberedStropheMark, ChorusMark] + [NumberedStropheMark] * (len(strophe_types) - 2)
-        if strophe_types == type_pattern:
-            # Inlay chorus repetition after the second and each subsequent strophe.
-            repeat_chorus = StropheRepeat(items[1])
-            inlaid = items[:2] + [item for strophe in items[2:] for item in (strophe, repeat_chorus)]
-            return inlaid
-        return items
+        # The pattern only applies when every item is a strophe, the second is the chorus and all
+        # others are numbered; bail out at the first mismatch instead of materializing the full
+        # mark type list and a same-length pattern list to compare against.
+        for i, item in enumerate(items):
+            if not isinstance(item, Strophe):
+                return items
+            mark_type = type(item.mark)
+            if i == 1:
+                if mark_type is not ChorusMark:
+                    return items
+            elif mark_type is not NumberedStropheMark:
+                return items
+        # Inlay chorus repetition after the second and each subsequent strophe.
+        repeat_chorus = StropheRepeat(items[1])
+        inlaid = items[:2] + [item for strophe in items[2:] for item in (strophe, repeat_chorus)]
+        return inlaid
 
     @staticmethod
-    def _fill_initial_plain_segments(items: list[Strophe | Annotation]) -> list[Strophe | Annotation]:
+    def _fill_initial_plain_segments(
+        items: list[Strophe | Annotation], strophes: list[tuple[int, Strophe]]
+    ) -> list[Strophe | Annotation]:
         replacements = []
-        strophes: list[tuple[int, Strophe]] = [(i, item) for i, item in enumerate(items) if isinstance(item, Strophe)]
-        for prev, current in zip(strophes[:-1], strophes[1:]):
-            prev_i, prev_strophe = prev
-            cur_i, cur_strophe = current
-            if cur_strophe.segments and isinstance(cur_strophe.segments[0], PlainSegment):
-                if prev_strophe.segments and isinstance(prev_strophe.segments[-1], ChordedSegment):
-                    replacements.append(
-                        (cur_i, ChordedSegment(chord=prev_strophe.segments[-1].chord, text=cur_strophe.segments[0].text))
-                    )
+        for (prev_i, prev_strophe), (cur_i, cur_strophe) in itertools.pairwise(strophes):
+            # Cheapest checks first: both emptiness tests before any isinstance.
+            if (
+                cur_strophe.segments
+                and prev_strophe.segments
+                and isinstance(cur_strophe.segments[0], PlainSegment)
+                and isinstance(prev_strophe.segments[-1], ChordedSegment)
+            ):
+                replacements.append(
+                    (cur_i, ChordedSegment(chord=prev_strophe.segments[-1].chord, text=cur_strophe.segments[0].text))
+                )
         for item_i, repl in replacements:
             items[item_i].segments[0] = repl
         return items
 
     @staticmethod
-    def _recognize_codas(items: list[Strophe | Annotation]) -> list[Strophe | Annotation]:
-        marks = [(i, item.mark) for i, item in enumerate(items) if isinstance(item, Strophe)]
-        letter_counts = collections.Counter(mark.letter for i, mark in marks if isinstance(mark, LetteredStropheMark))
-        if letter_counts == {"C": 1} and marks[-1][1] == LetteredStropheMark("C"):
-            items[marks[-1][0]].mark = CodaMark()
-            return items
+    def _recognize_codas(
+        items: list[Strophe | Annotation], strophes: list[tuple[int, Strophe]]
+    ) -> list[Strophe | Annotation]:
+        letter_counts = collections.Counter(
+            strophe.mark.letter for _, strophe in strophes if isinstance(strophe.mark, LetteredStropheMark)
+        )
+        if letter_counts == {"C": 1} and strophes[-1][1].mark == LetteredStropheMark("C"):
+            strophes[-1][1].mark = CodaMark()
         return items
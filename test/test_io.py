@@ -1,19 +1,18 @@
+import json
 from pathlib import Path
 
-from pysongbook.io import ModifiedSongsLatexChordParser, DefaultChordParser
+from pysongbook.io import ModifiedSongsLatexChordParser, DefaultChordParser, DefaultFormat, ModelDictFormat
+from pysongbook.model import AuthorAnnotation, Strophe
 
 import pytest
 
-# ahoj_slunko_path = Path(__file__).parent / "data" / "ahoj_slunko.txt"
+ahoj_slunko_path = Path(__file__).parent / "data" / "ahoj_slunko.txt"
 
-# TODO install pytest
-# @pytest.fixture(scope="session")
-# def ahoj_slunko_text():
-#     with ahoj_slunko_path.open() as f:
-#         return f.read()
 
-# with ahoj_slunko_path.open() as f:
-#     ahoj_slunko_text = f.read()
+@pytest.fixture(scope="session")
+def ahoj_slunko_text():
+    # Session-scoped so the file is read once, and only when a test actually asks for it.
+    return ahoj_slunko_path.read_text(encoding="utf8")
 
 
 @pytest.mark.parametrize("latex, normal", [
@@ -26,3 +25,28 @@ import pytest
 ])
 def test_modif_songs_latex_chord_parser(latex, normal):
     assert ModifiedSongsLatexChordParser().parse(latex) == DefaultChordParser().parse(normal)
+
+
+def test_default_format_loads(ahoj_slunko_text):
+    song = DefaultFormat().loads(ahoj_slunko_text)
+    assert song.get_title() == "Ahoj slunko"
+    assert [annot.name for annot in song.get_annotations_of_type(AuthorAnnotation)] == ["Jaromír Nohavica"]
+    assert any(isinstance(item, Strophe) and item.segments for item in song.items)
+
+
+def _assert_no_private_keys(obj):
+    if isinstance(obj, dict):
+        assert not any(key.startswith("_") for key in obj)
+        for value in obj.values():
+            _assert_no_private_keys(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            _assert_no_private_keys(value)
+
+
+def test_model_dict_format_dumps(ahoj_slunko_text):
+    song = DefaultFormat().loads(ahoj_slunko_text)
+    DefaultFormat().dumps(song)  # populate the lazy model caches; they must not leak into the dict dump
+    dumped = json.loads(ModelDictFormat().dumps(song))
+    assert dumped["annotations"]
+    _assert_no_private_keys(dumped)